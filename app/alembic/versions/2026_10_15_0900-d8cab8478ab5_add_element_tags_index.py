@@ -0,0 +1,28 @@
+"""Add element tags index
+
+Revision ID: d8cab8478ab5
+Revises: 701a84ad141f
+Create Date: 2026-10-15 09:00:12.418307+00:00
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8cab8478ab5'
+down_revision: str | None = '701a84ad141f'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # build without locking the element table for writes
+    with op.get_context().autocommit_block():
+        op.create_index('element_tags_idx', 'element', ['tags'], unique=False, postgresql_where=sa.text('next_sequence_id IS NULL'), postgresql_using='gin', postgresql_ops={'tags': 'jsonb_path_ops'}, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('element_tags_idx', table_name='element', postgresql_where=sa.text('next_sequence_id IS NULL'), postgresql_using='gin', postgresql_ops={'tags': 'jsonb_path_ops'}, postgresql_concurrently=True)
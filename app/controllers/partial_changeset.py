@@ -8,7 +8,7 @@ from app.format.element_list import FormatElementList
 from app.lib.auth_context import auth_user
 from app.lib.options_context import options_context
 from app.lib.render_response import render_response
-from app.lib.tags_format import tags_format
+from app.lib.tags_format import tag_format, tags_format
 from app.lib.translation import t
 from app.models.db.changeset import Changeset
 from app.models.db.changeset_comment import ChangesetComment
@@ -72,10 +72,15 @@ async def get_changeset(id: PositiveInt):
     elements = elements_t.result()
     is_subscribed = is_subscribed_task.result() if (is_subscribed_task is not None) else False
 
-    tags = tags_format(changeset.tags)
-    comment_tag = tags.pop('comment', None)
-    if comment_tag is None:
-        comment_tag = TagFormat('comment', t('browse.no_comment'))
+    # comments are mostly unique: format them separately to keep the tags_format cache effective
+    changeset_tags = changeset.tags.copy()
+    comment_str = changeset_tags.pop('comment', None)
+    comment_tag = (
+        tag_format('comment', comment_str)
+        if (comment_str is not None)
+        else TagFormat('comment', t('browse.no_comment'))
+    )
+    tags = tags_format(changeset_tags)
 
     return render_response(
         'partial/changeset.jinja2',
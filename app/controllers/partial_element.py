@@ -8,17 +8,18 @@ from pydantic import PositiveInt
 from sqlalchemy.orm import joinedload
 
 from app.format import FormatLeaflet
-from app.format.element_list import FormatElementList, MemberListEntry
+from app.format.element_list import FormatElementList
 from app.lib.feature_name import features_names
 from app.lib.options_context import options_context
 from app.lib.render_response import render_response
-from app.lib.tags_format import tags_format
+from app.lib.tags_format import tag_format, tags_format
 from app.lib.translation import t
 from app.limits import ELEMENT_HISTORY_PAGE_SIZE
 from app.models.db.changeset import Changeset
 from app.models.db.element import Element
 from app.models.db.user import User
 from app.models.element import ElementId, ElementRef, ElementType, VersionedElementRef
+from app.models.element_list_entry import MemberListEntry
 from app.models.tags_format import TagFormat
 from app.queries.changeset_query import ChangesetQuery
 from app.queries.element_member_query import ElementMemberQuery
@@ -30,26 +31,17 @@ router = APIRouter(prefix='/api/partial')
 
 @router.get('/{type:element_type}/{id:int}')
 async def get_latest(type: ElementType, id: Annotated[ElementId, PositiveInt]):
-    at_sequence_id = await ElementQuery.get_current_sequence_id()
-
     ref = ElementRef(type, id)
-    elements = await ElementQuery.get_by_refs(
-        (ref,),
-        at_sequence_id=at_sequence_id,
-        limit=1,
-    )
-    element = elements[0] if elements else None
+    result = await ElementQuery.find_current_by_ref(ref)
 
-    if element is None:
+    if result is None:
         return render_response(
             'partial/not_found.jinja2',
             {'type': type, 'id': id},
         )
 
-    # if the element was superseded (very small chance), get data just before
-    last_sequence_id = await ElementQuery.get_last_visible_sequence_id(element)
-    if last_sequence_id is not None:
-        at_sequence_id = last_sequence_id
+    # element is latest within the at_sequence_id snapshot (next_sequence_id is null)
+    element, at_sequence_id = result
 
     await ElementMemberQuery.resolve_members((element,))
     data = await _get_element_data(element, at_sequence_id, include_parents=True)
@@ -206,7 +198,7 @@ async def _get_element_data(element: Element, at_sequence_id: int, *, include_pa
     changeset = changeset_t.result()
     comment_str = changeset.tags.get('comment')
     comment_tag = (
-        tags_format({'comment': comment_str})['comment']
+        tag_format('comment', comment_str)
         if (comment_str is not None)
         else TagFormat('comment', t('browse.no_comment'))
     )
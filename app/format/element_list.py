@@ -1,5 +1,4 @@
 from collections.abc import Collection, Iterable
-from dataclasses import dataclass
 
 import cython
 
@@ -8,29 +7,10 @@ from app.lib.feature_name import features_names
 from app.models.db.element import Element
 from app.models.db.element_member import ElementMember
 from app.models.element import ElementId, ElementRef, ElementType, VersionedElementRef
+from app.models.element_list_entry import ChangesetListEntry, MemberListEntry
 from app.queries.element_query import ElementQuery
 
 
-@dataclass(frozen=True, slots=True)
-class _Base:
-    type: ElementType
-    id: int
-    name: str | None
-    icon: str | None
-    icon_title: str | None
-
-
-@dataclass(frozen=True, slots=True)
-class ChangesetListEntry(_Base):
-    version: int
-    visible: bool
-
-
-@dataclass(frozen=True, slots=True)
-class MemberListEntry(_Base):
-    role: str | None
-
-
 class FormatElementList:
     @staticmethod
     async def changeset_elements(elements: Collection[Element]) -> dict[ElementType, list[ChangesetListEntry]]:
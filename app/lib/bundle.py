@@ -1,5 +1,6 @@
 from collections import namedtuple
 from dataclasses import field, make_dataclass
+from functools import lru_cache
 from typing import Any, override
 
 from sqlalchemy import Row
@@ -9,7 +10,7 @@ from sqlalchemy.orm import Bundle
 class TupleBundle(Bundle):
     @override
     def create_row_processor(self, query, procs, labels):
-        t = namedtuple('t', labels)  # noqa: PYI024  # pyright: ignore[reportUntypedNamedTuple]
+        t = _make_tuple(tuple(labels))
 
         def proc(row: Row):
             return t(*row)
@@ -19,27 +20,38 @@ class TupleBundle(Bundle):
 
 class NamespaceBundle(Bundle):
     def __init__(self, name: str, *exprs, extra_fields: dict[str, Any], **kw):
-        self._extra_fields = extra_fields
+        self._extra_fields = tuple(extra_fields.items())
         super().__init__(name, *exprs, **kw)
 
     @override
     def create_row_processor(self, query, procs, labels):
-        ns = make_dataclass(
-            self.name,
-            (
-                *labels,
-                *(
-                    (k, Any, field(default=v))  #
-                    for k, v in self._extra_fields.items()
-                ),
-            ),
-            repr=False,
-            eq=False,
-            match_args=False,
-            slots=True,
-        )
+        ns = _make_namespace(self.name, tuple(labels), self._extra_fields)
 
         def proc(row: Row):
             return ns(*row)
 
         return proc
+
+
+# row processors are created on every execution, reuse the generated row types
+@lru_cache(maxsize=128)
+def _make_tuple(labels: tuple[str, ...]) -> type:
+    return namedtuple('t', labels)  # noqa: PYI024  # pyright: ignore[reportUntypedNamedTuple]
+
+
+@lru_cache(maxsize=128)
+def _make_namespace(name: str, labels: tuple[str, ...], extra_fields: tuple[tuple[str, Any], ...]) -> type:
+    return make_dataclass(
+        name,
+        (
+            *labels,
+            *(
+                (k, Any, field(default=v))  #
+                for k, v in extra_fields
+            ),
+        ),
+        repr=False,
+        eq=False,
+        match_args=False,
+        slots=True,
+    )
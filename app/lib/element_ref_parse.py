@@ -0,0 +1,58 @@
+import cython
+
+
+def parse_ref_id(s: str, start: int) -> int:
+    """
+    Parse the element id from the given string, starting at the given index.
+
+    >>> parse_ref_id('n123', 1)
+    123
+    """
+    id = _parse_int(s, start, len(s))
+    if id == 0:
+        raise ValueError('Element id cannot be 0')
+    return id
+
+
+def parse_versioned_ref_id(s: str, start: int) -> tuple[int, int]:
+    """
+    Parse the element id and version from the given string, starting at the given index.
+
+    >>> parse_versioned_ref_id('n123v1', 1)
+    (123, 1)
+    """
+    idx = s.rindex('v')
+    id = _parse_int(s, start, idx)
+    version = _parse_int(s, idx + 1, len(s))
+    if id == 0:
+        raise ValueError('Element id cannot be 0')
+    if version <= 0:
+        raise ValueError('Element version must be positive')
+    return id, version
+
+
+@cython.cfunc
+def _parse_int(s: str, start: cython.Py_ssize_t, end: cython.Py_ssize_t) -> cython.longlong:
+    # manual digit scan avoids slicing allocations
+    if start >= end:
+        raise ValueError(f'Invalid integer in {s!r}')
+
+    negative: cython.char = s[start] == '-'
+    if negative:
+        start += 1
+        if start >= end:
+            raise ValueError(f'Invalid integer in {s!r}')
+
+    # 18 digits always fit in int64, reject early to behave the same when compiled
+    if end - start > 18:
+        raise ValueError(f'Integer too large in {s!r}')
+
+    result: cython.longlong = 0
+    i: cython.Py_ssize_t
+    for i in range(start, end):
+        c = s[i]
+        if not ('0' <= c <= '9'):
+            raise ValueError(f'Invalid integer in {s!r}')
+        result = result * 10 + (ord(c) - 48)
+
+    return -result if negative else result
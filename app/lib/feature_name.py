@@ -1,4 +1,5 @@
 from collections.abc import Iterable
+from functools import lru_cache
 
 import cython
 
@@ -13,15 +14,21 @@ def features_names(elements: Iterable[Element]) -> tuple[str | None, ...]:
     >>> features_names(...)
     ('Foo', ...)
     """
-    return tuple(_feature_name(e.tags) for e in elements)
+    name_keys = _name_keys(translation_locales())
+    return tuple(_feature_name(name_keys, e.tags) for e in elements)
+
+
+@lru_cache(maxsize=256)
+def _name_keys(locales: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(f'name:{locale}' for locale in locales)
 
 
 @cython.cfunc
-def _feature_name(tags: dict[str, str]):
+def _feature_name(name_keys: tuple[str, ...], tags: dict[str, str]):
     if not tags:
         return None
-    for locale in translation_locales():
-        if name := tags.get(f'name:{locale}'):
+    for name_key in name_keys:
+        if name := tags.get(name_key):
             return name
 
     if name := tags.get('name'):
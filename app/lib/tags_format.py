@@ -1,7 +1,8 @@
 import json
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import cython
 import phonenumbers
@@ -13,7 +14,9 @@ from phonenumbers import (
     is_valid_number,
 )
 
+from app.lib.lru_cache import LRUCache
 from app.lib.rich_text import TextFormat, process_rich_text
+from app.lib.translation import translation_locales
 from app.lib.wiki_pages import tags_format_osm_wiki
 from app.models.tags_format import TagFormat, ValueFormat
 from app.validators.email import validate_email
@@ -28,27 +31,56 @@ _w3c_colors = frozenset(json.loads(Path('config/w3c_colors.json').read_bytes()))
 _wiki_lang_re = re.compile(r'^[a-zA-Z]{2,3}(?:-[a-zA-Z0-9]{1,8})?$')
 _wiki_lang_value_re = re.compile(r'^(?P<lang>[a-zA-Z]{2,3}(?:-[a-zA-Z0-9]{1,8})?):(?P<text>.+)$')
 
+# wiki links depend on the locales, so they are part of the key
+_cache: LRUCache[tuple, Mapping[str, TagFormat]] = LRUCache(maxsize=1024)
 
-def tags_format(tags: dict[str, str]) -> dict[str, TagFormat]:
+
+def tags_format(tags: dict[str, str]) -> Mapping[str, TagFormat]:
     """
     Format tags for displaying on the website (colors, urls, etc.).
 
-    Returns a mapping of tag keys to TagFormats.
+    Returns a read-only mapping of tag keys to TagFormats.
+    The result is cached and shared between calls.
     """
-    result = dict(sorted((key, TagFormat(key, value)) for key, value in tags.items()))
+    cache_key = (translation_locales(), *tags.items())
+    result = _cache.get(cache_key)
+    if result is None:
+        result = MappingProxyType(_tags_format(tags))
+        _cache[cache_key] = result
+    return result
 
-    for tag in result.values():
-        key_parts = tag.key.text.split(':', maxsplit=5)  # split a:b:c keys into ['a', 'b', 'c']
-        values = tag.values
-        for key_part in _supported_keys.intersection(key_parts):
-            for call in _formatter_map[key_part]:
-                values = call(key_parts, values)
-        tag.values = values
 
+def tag_format(key: str, value: str) -> TagFormat:
+    """
+    Format a single tag for displaying on the website.
+
+    Unlike tags_format, the result is not cached.
+    """
+    tag = TagFormat(key, value)
+    _format_values(tag)
+    tags_format_osm_wiki((tag,))
+    return tag
+
+
+@cython.cfunc
+def _tags_format(tags: dict[str, str]) -> dict[str, TagFormat]:
+    result = dict(sorted((key, TagFormat(key, value)) for key, value in tags.items()))
+    for tag in result.values():
+        _format_values(tag)
     tags_format_osm_wiki(result.values())
     return result
 
 
+@cython.cfunc
+def _format_values(tag: TagFormat) -> None:
+    key_parts = tag.key.text.split(':', maxsplit=5)  # split a:b:c keys into ['a', 'b', 'c']
+    values = tag.values
+    for key_part in _supported_keys.intersection(key_parts):
+        for call in _formatter_map[key_part]:
+            values = call(key_parts, values)
+    tag.values = values
+
+
 @cython.cfunc
 def _is_hex_color(s: str) -> cython.char:
     s_len: cython.int = len(s)
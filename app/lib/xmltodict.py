@@ -86,7 +86,7 @@ def _parse_element(element: ET._Element):
     k: str
     v: Any
     v_str: str
-    for k, v_str in element.attrib.items():  # pyright: ignore[reportAssignmentType]
+    for k, v_str in element.items():  # pyright: ignore[reportAssignmentType]
         k = '@' + k
         call = value_postprocessor.get(k)
         if call is not None:
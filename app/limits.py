@@ -68,7 +68,9 @@ ISSUE_COMMENT_BODY_MAX_LENGTH = 5_000  # NOTE: value TBD
 
 LOCALE_CODE_MAX_LENGTH = 15
 
+MAIL_PROCESSING_BATCH_SIZE = 32
 MAIL_PROCESSING_TIMEOUT = timedelta(minutes=1)
+MAIL_SMTP_POOL_SIZE = 4
 MAIL_UNPROCESSED_EXPONENT = 2  # 1 min, 2 mins, 4 mins, etc.
 MAIL_UNPROCESSED_EXPIRE = timedelta(days=3)
 
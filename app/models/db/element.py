@@ -56,4 +56,11 @@ class Element(Base.NoID, CreatedAtMixin):
             postgresql_where=and_(type == 'node', visible == true(), next_sequence_id == null()),
             postgresql_using='gist',
         ),
+        Index(
+            'element_tags_idx',
+            tags,
+            postgresql_where=next_sequence_id == null(),
+            postgresql_using='gin',
+            postgresql_ops={'tags': 'jsonb_path_ops'},
+        ),
     )
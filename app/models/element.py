@@ -1,32 +1,29 @@
-from functools import lru_cache
 from typing import Literal, NamedTuple, NewType, Self, override
 
+from app.lib.element_ref_parse import parse_ref_id, parse_versioned_ref_id
+
 ElementId = NewType('ElementId', int)
 ElementType = Literal['node', 'way', 'relation']
 
+_TYPE_CHAR: dict[ElementType, str] = {'node': 'n', 'way': 'w', 'relation': 'r'}
+_CHAR_TYPE: dict[str, ElementType] = {v: k for k, v in _TYPE_CHAR.items()}
+
 
-@lru_cache(maxsize=512)
 def element_type(s: str) -> ElementType:
     """
     Get the element type from the given string.
 
-    >>> _element_type('node')
+    >>> element_type('node')
     'node'
-    >>> _element_type('w123')
+    >>> element_type('w123')
     'way'
     """
     if len(s) == 0:
         raise ValueError('Element type cannot be empty')
-
-    c = s[0]
-    if c == 'n':
-        return 'node'
-    elif c == 'w':
-        return 'way'
-    elif c == 'r':
-        return 'relation'
-    else:
+    type = _CHAR_TYPE.get(s[0])
+    if type is None:
         raise ValueError(f'Unknown element type {s!r}')
+    return type
 
 
 class ElementRef(NamedTuple):
@@ -42,9 +39,7 @@ class ElementRef(NamedTuple):
         ElementRef(type='node', id=123)
         """
         type = element_type(s)
-        id = ElementId(int(s[1:]))
-        if id == 0:
-            raise ValueError('Element id cannot be 0')
+        id = ElementId(parse_ref_id(s, 1))
         return cls(type, id)
 
     @override
@@ -55,7 +50,7 @@ class ElementRef(NamedTuple):
         >>> ElementRef(ElementType.node, 123)
         'n123'
         """
-        return f'{self.type[0]}{self.id}'
+        return f'{_TYPE_CHAR[self.type]}{self.id}'
 
 
 class VersionedElementRef(NamedTuple):
@@ -72,14 +67,8 @@ class VersionedElementRef(NamedTuple):
         VersionedElementRef(type='node', id=123, version=1)
         """
         type = element_type(s)
-        idx = s.rindex('v')
-        id = ElementId(int(s[1:idx]))
-        version = int(s[idx + 1 :])
-        if id == 0:
-            raise ValueError('Element id cannot be 0')
-        if version <= 0:
-            raise ValueError('Element version must be positive')
-        return cls(type, id, version)
+        id, version = parse_versioned_ref_id(s, 1)
+        return cls(type, ElementId(id), version)
 
     @classmethod
     def from_type_str(cls, type: ElementType, s: str) -> Self:
@@ -89,14 +78,8 @@ class VersionedElementRef(NamedTuple):
         >>> VersionedElementRef.from_type_str(ElementType.node, '123v1')
         VersionedElementRef(type='node', id=123, version=1)
         """
-        idx = s.rindex('v')
-        id = ElementId(int(s[:idx]))
-        version = int(s[idx + 1 :])
-        if id == 0:
-            raise ValueError('Element id cannot be 0')
-        if version <= 0:
-            raise ValueError('Element version must be positive')
-        return cls(type, id, version)
+        id, version = parse_versioned_ref_id(s, 0)
+        return cls(type, ElementId(id), version)
 
     @override
     def __str__(self) -> str:
@@ -106,4 +89,4 @@ class VersionedElementRef(NamedTuple):
         >>> VersionedElementRef(ElementType.node, 123, 1)
         'n123v1'
         """
-        return f'{self.type[0]}{self.id}v{self.version}'
+        return f'{_TYPE_CHAR[self.type]}{self.id}v{self.version}'
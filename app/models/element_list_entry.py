@@ -0,0 +1,20 @@
+import msgspec
+
+from app.models.element import ElementType
+
+
+class _Base(msgspec.Struct, frozen=True):
+    type: ElementType
+    id: int
+    name: str | None
+    icon: str | None
+    icon_title: str | None
+
+
+class ChangesetListEntry(_Base, frozen=True):
+    version: int
+    visible: bool
+
+
+class MemberListEntry(_Base, frozen=True):
+    role: str | None
@@ -7,7 +7,21 @@ from typing import Literal
 
 import cython
 from shapely.geometry.base import BaseGeometry
-from sqlalchemy import Select, and_, func, null, or_, select, text, true, union_all
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    Select,
+    and_,
+    any_,
+    func,
+    literal,
+    null,
+    or_,
+    select,
+    text,
+    true,
+    union_all,
+)
 
 from app.config import LEGACY_SEQUENCE_ID_MARGIN
 from app.db import db
@@ -144,7 +158,7 @@ class ElementQuery:
                     *(
                         and_(
                             Element.type == type,
-                            Element.id.in_(text(','.join(map(str, ids)))),
+                            _id_in(ids),
                         )
                         for type, ids in type_id_map.items()
                     )
@@ -245,6 +259,28 @@ class ElementQuery:
 
             return (await session.scalars(stmt)).all()
 
+    @staticmethod
+    async def find_current_by_ref(element_ref: ElementRef) -> tuple[Element, int] | None:
+        """
+        Find the current element by the given element ref.
+
+        Returns the element together with the current sequence id.
+        Both are fetched in a single query, making them consistent with each other.
+        """
+        async with db() as session:
+            stmt = (
+                _select()
+                .add_columns(select(func.max(Element.sequence_id)).correlate(None).scalar_subquery())
+                .where(
+                    Element.next_sequence_id == null(),
+                    Element.type == element_ref.type,
+                    Element.id == element_ref.id,
+                )
+                .limit(1)
+            )
+            row = (await session.execute(stmt)).first()
+            return (row[0], row[1]) if (row is not None) else None
+
     @staticmethod
     async def get_by_refs(
         element_refs: Collection[ElementRef],
@@ -276,7 +312,7 @@ class ElementQuery:
                         )
                     ),
                     Element.type == type,
-                    Element.id.in_(text(','.join(map(str, ids)))),
+                    _id_in(ids),
                 )
 
                 if limit is not None:
@@ -407,7 +443,7 @@ class ElementQuery:
                         *(
                             and_(
                                 Element.type == type,
-                                Element.id.in_(text(','.join(map(str, ids)))),
+                                _id_in(ids),
                             )
                             for type, ids in type_id_map.items()
                         )
@@ -488,7 +524,7 @@ class ElementQuery:
                         *(
                             and_(
                                 Element.type == type,
-                                Element.id.in_(text(','.join(map(str, ids)))),
+                                _id_in(ids),
                             )
                             for type, ids in type_id_map.items()
                         )
@@ -677,6 +713,12 @@ class ElementQuery:
             return await session.scalar(stmt)
 
 
+@cython.cfunc
+def _id_in(ids: Iterable[ElementId]):
+    # array parameter keeps the statement text stable, reusing the prepared statement
+    return Element.id == any_(literal(list(ids), ARRAY(BigInteger, dimensions=1)))
+
+
 @cython.cfunc
 def _select():
     bundle = NamespaceBundle(
@@ -1,14 +1,15 @@
 import logging
-from asyncio import Lock, get_running_loop, timeout
+from asyncio import Lock, Semaphore, TaskGroup, get_running_loop, timeout
 from contextlib import asynccontextmanager, suppress
-from datetime import timedelta
+from datetime import datetime, timedelta
 from email.message import EmailMessage
 from email.utils import formataddr, formatdate
 from typing import Any
 
 import cython
-from aiosmtplib import SMTP
+from aiosmtplib import SMTP, SMTPServerDisconnected
 from sqlalchemy import null, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.config import (
@@ -24,13 +25,23 @@ from app.lib.auth_context import auth_context
 from app.lib.date_utils import utcnow
 from app.lib.jinja_env import render
 from app.lib.translation import translation_context
-from app.limits import MAIL_PROCESSING_TIMEOUT, MAIL_UNPROCESSED_EXPIRE, MAIL_UNPROCESSED_EXPONENT
+from app.limits import (
+    MAIL_PROCESSING_BATCH_SIZE,
+    MAIL_PROCESSING_TIMEOUT,
+    MAIL_SMTP_POOL_SIZE,
+    MAIL_UNPROCESSED_EXPIRE,
+    MAIL_UNPROCESSED_EXPONENT,
+)
 from app.models.db.mail import Mail, MailSource
 from app.models.db.user import User
 from app.services.user_token_email_reply_service import UserTokenEmailReplyService
 
 _process_lock = Lock()
 
+# persistent connections, reused across mail and processing runs
+_smtp_pool: list[SMTP] = []
+_smtp_limiter = Semaphore(MAIL_SMTP_POOL_SIZE)
+
 
 class EmailService:
     @asynccontextmanager
@@ -43,6 +54,14 @@ class EmailService:
         task = loop.create_task(_process_task())
         yield
         task.cancel()  # avoid "Task was destroyed" warning during tests
+        # connections still in use are dropped with the process, which servers treat as an aborted session
+        for smtp in _smtp_pool:
+            if smtp.is_connected:
+                with suppress(Exception):
+                    async with timeout(5):
+                        await smtp.quit()
+            smtp.close()
+        _smtp_pool.clear()
 
     @staticmethod
     async def schedule(
@@ -97,7 +116,7 @@ async def _process_task() -> None:
 async def _process_task_inner() -> None:
     logging.debug('Started scheduled mail processing')
 
-    async with _smtp_factory() as smtp, db() as session:
+    async with db() as session:
         while True:
             now = utcnow()
             stmt = (
@@ -118,39 +137,55 @@ async def _process_task_inner() -> None:
                     Mail.created_at,
                 )
                 .with_for_update(of=Mail, skip_locked=True)
-                .limit(1)
+                .limit(MAIL_PROCESSING_BATCH_SIZE)
             )
 
-            mail = await session.scalar(stmt)
-            if mail is None:
+            mails = (await session.scalars(stmt)).all()
+            if not mails:
                 logging.debug('Finished scheduled mail processing')
                 break
 
             try:
-                logging.debug('Processing mail %r', mail.id)
-                await _send_mail(smtp, mail)
-                await session.delete(mail)
-            except Exception:
-                expires_at = mail.created_at + MAIL_UNPROCESSED_EXPIRE
-                processing_at = now + timedelta(minutes=mail.processing_counter**MAIL_UNPROCESSED_EXPONENT)
-
-                if expires_at <= processing_at:
-                    logging.warning(
-                        'Expiring unprocessed mail %r, created at: %r',
-                        mail.id,
-                        mail.created_at,
-                        exc_info=True,
-                    )
-                    await session.delete(mail)
-                else:
-                    logging.info('Requeuing unprocessed mail %r', mail.id, exc_info=True)
-                    mail.processing_counter += 1
-                    mail.processing_at = processing_at
+                async with TaskGroup() as tg:
+                    tasks = tuple(tg.create_task(_send_mail_task(mail)) for mail in mails)
+                for mail, task in zip(mails, tasks, strict=True):
+                    await _process_mail(session, mail, task.result(), now)
             finally:
                 await session.commit()
 
 
-async def _send_mail(smtp: SMTP, mail: Mail) -> None:
+async def _send_mail_task(mail: Mail) -> Exception | None:
+    try:
+        logging.debug('Processing mail %r', mail.id)
+        await _send_mail(mail)
+    except Exception as e:
+        return e
+    return None
+
+
+async def _process_mail(session: AsyncSession, mail: Mail, error: Exception | None, now: datetime) -> None:
+    if error is None:
+        await session.delete(mail)
+        return
+
+    expires_at = mail.created_at + MAIL_UNPROCESSED_EXPIRE
+    processing_at = now + timedelta(minutes=mail.processing_counter**MAIL_UNPROCESSED_EXPONENT)
+
+    if expires_at <= processing_at:
+        logging.warning(
+            'Expiring unprocessed mail %r, created at: %r',
+            mail.id,
+            mail.created_at,
+            exc_info=error,
+        )
+        await session.delete(mail)
+    else:
+        logging.info('Requeuing unprocessed mail %r', mail.id, exc_info=error)
+        mail.processing_counter += 1
+        mail.processing_at = processing_at
+
+
+async def _send_mail(mail: Mail) -> None:
     # TODO: deleted users
     # if not mail.to_user:
     #     logging.info('Discarding mail %r to user %d (not found)', mail.id, mail.to_user_id)
@@ -182,12 +217,44 @@ async def _send_mail(smtp: SMTP, mail: Mail) -> None:
         message['References'] = full_ref
         message['X-Entity-Ref-ID'] = full_ref  # disables threading in gmail
 
-    async with timeout(MAIL_PROCESSING_TIMEOUT.total_seconds() - 5):
-        await smtp.send_message(message)
+    # wait for a free connection first, so that queued mails don't spend their time budget
+    async with _acquire_smtp() as smtp, timeout(MAIL_PROCESSING_TIMEOUT.total_seconds() - 5):
+        reused = smtp.is_connected
+        if not reused:
+            await smtp.connect()
+        try:
+            await smtp.send_message(message)
+        except SMTPServerDisconnected:
+            if not reused:
+                raise
+            # pooled connection went stale while idle, reconnect and retry once
+            logging.debug('Reconnecting stale SMTP connection for mail %r', mail.id)
+            smtp.close()
+            await smtp.connect()
+            await smtp.send_message(message)
 
     logging.info('Sent mail %r to user %d with subject %r', mail.id, mail.to_user_id, mail.subject)
 
 
+@asynccontextmanager
+async def _acquire_smtp():
+    """
+    Acquire a persistent SMTP connection from the pool.
+
+    The connection may not be connected yet.
+    """
+    async with _smtp_limiter:
+        smtp = _smtp_pool.pop() if _smtp_pool else _smtp_factory()
+        try:
+            yield smtp
+        except BaseException:
+            # connection state is unknown after a failure, reconnect on next use
+            smtp.close()
+            raise
+        finally:
+            _smtp_pool.append(smtp)
+
+
 @cython.cfunc
 def _smtp_factory():
     port = SMTP_PORT
@@ -15,15 +15,18 @@ from app.limits import DNS_CACHE_EXPIRE
 JSON_ENCODE = msgspec.json.Encoder(decimal_format='number', order='sorted').encode
 JSON_DECODE = msgspec.json.Decoder().decode
 
+# key order is irrelevant for payloads consumed by JavaScript and the database
+_JSON_ENCODE_UNSORTED = msgspec.json.Encoder(decimal_format='number').encode
+
 
 def json_encodes(obj: Any) -> str:
     """
-    Like JSON_ENCODE, but returns a string.
+    Like JSON_ENCODE, but returns a string and skips key sorting.
 
     >>> json_encodes({'foo': 'bar'})
-    '{"foo": "bar"}'
+    '{"foo":"bar"}'
     """
-    return JSON_ENCODE(obj).decode()
+    return _JSON_ENCODE_UNSORTED(obj).decode()
 
 
 @cache
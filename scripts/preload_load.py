@@ -4,21 +4,26 @@ from asyncio import Semaphore, TaskGroup
 from functools import cache
 from pathlib import Path
 from subprocess import Popen
+from time import perf_counter
 
 import uvloop
-from sqlalchemy import Index, quoted_name, select, text
+from sqlalchemy import Index, select, text
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import PRELOAD_DIR
 from app.db import db, db_commit, db_update_stats
 from app.models.db import *  # noqa: F403
+from app.models.db.base import Base
 from app.models.db.changeset import Changeset
 from app.models.db.element import Element
 from app.models.db.element_member import ElementMember
 from app.models.db.user import User
 from app.services.migration_service import MigrationService
 
-_index_limiter = Semaphore(6)
+# each index build uses up to _INDEX_WORK_MEM, keep the total within the config/postgres.nix target
+# (8GB RAM, 2GB of it for shared_buffers); parallel maintenance workers share the same budget
+_INDEX_WORK_MEM = '2GB'
+_index_limiter = Semaphore(2)
 
 # freeze all gc objects before starting for improved performance
 gc.collect()
@@ -53,52 +58,85 @@ def get_csv_header(path: Path) -> str:
 
 async def load_tables() -> None:
     tables: tuple[type[DeclarativeBase], ...] = (User, Changeset, Element, ElementMember)
-    index_sqls: dict[quoted_name, str] = {}
+    index_names: list[str] = [
+        index.name  # pyright: ignore[reportAttributeAccessIssue]
+        for table in tables
+        for index in table.__table_args__
+        if isinstance(index, Index)
+    ]
+
+    # truncate of foreign key targets requires the referencing tables in the same statement
+    referenced_tables = {
+        fk.column.table.name
+        for table in Base.NoID.metadata.tables.values()  #
+        for fk in table.foreign_keys
+    }
+
+    # validate all inputs before any destructive changes
+    csv_paths = {table.__tablename__: get_csv_path(table.__tablename__) for table in tables}
+    csv_headers = {table_name: get_csv_header(path) for table_name, path in csv_paths.items()}
+    for table_name, header in csv_headers.items():
+        if not header:
+            raise ValueError(f'Missing CSV header for {table_name!r} table')
 
     async with db_commit() as session:
-        # disable triggers
-        await session.execute(text('SET session_replication_role TO replica'))
-
-        # copy freeze requires truncate
         print('Truncating tables')
         await session.execute(
             text(f'TRUNCATE {','.join(f'"{t.__tablename__}"' for t in tables)} RESTART IDENTITY CASCADE')
         )
 
-        for table in tables:
-            table_name = table.__tablename__
+        rows = await session.execute(
+            text('SELECT indexname, indexdef FROM pg_indexes WHERE indexname = ANY(:names)'),
+            {'names': index_names},
+        )
+        index_sqls: dict[str, str] = dict(rows.tuples().all())
+        missing_indexes = set(index_names).difference(index_sqls)
+        if missing_indexes:
+            raise ValueError(f'Indexes not found in database: {', '.join(sorted(missing_indexes))}')
 
-            indexes = (arg for arg in table.__table_args__ if isinstance(arg, Index))
-            for index in indexes:
-                index_name = index.name
-                assert index_name is not None
-                print(f'Dropping index {index_name!r}')
-                sql = await session.scalar(text(f'SELECT pg_get_indexdef({index_name!r}::regclass)'))
-                index_sqls[index_name] = sql
-                await session.execute(text(f'DROP INDEX {index_name}'))
+        print(f'Dropping indexes {', '.join(index_sqls)}')
+        await session.execute(text(f'DROP INDEX {','.join(f'"{name}"' for name in index_sqls)}'))
 
-            path = get_csv_path(table_name)
-            header = get_csv_header(path)
-            columns = tuple(f'"{c}"' for c in header.split(','))
+    async def copy_task(table_name: str) -> None:
+        async with db_commit() as session:
+            # disable triggers
+            await session.execute(text('SET session_replication_role TO replica'))
+
+            # copy freeze requires truncate in the same transaction
+            freeze = table_name not in referenced_tables
+            if freeze:
+                await session.execute(text(f'TRUNCATE "{table_name}"'))
+
+            path = csv_paths[table_name]
+            columns = tuple(f'"{c}"' for c in csv_headers[table_name].split(','))
 
             print(f'Populating {table_name} table ({len(columns)} columns)...')
             await session.execute(
                 text(
                     f'COPY "{table_name}" ({','.join(columns)}) '
                     f"FROM PROGRAM 'zstd -d --stdout \"{path.absolute()}\"' "
-                    f'(FORMAT CSV, FREEZE, HEADER TRUE)'
+                    f'(FORMAT CSV{', FREEZE' if freeze else ''}, HEADER TRUE)'
                 ),
             )
 
-    async def index_task(sql: str) -> None:
+    async with TaskGroup() as tg:
+        for table in tables:
+            tg.create_task(copy_task(table.__tablename__))
+
+    async def index_task(key: str, sql: str) -> None:
         async with _index_limiter, db() as session:
             await session.connection(execution_options={'isolation_level': 'AUTOCOMMIT'})
+            # reduce external sort spills
+            await session.execute(text(f"SET maintenance_work_mem TO '{_INDEX_WORK_MEM}'"))
+
+            print(f'Recreating index {key!r}')
+            ts = perf_counter()
             await session.execute(text(sql))
+            print(f'Recreated index {key!r} in {perf_counter() - ts:.1f}s')
 
     async with TaskGroup() as tg:
         for key, sql in index_sqls.items():
-            print(f'Recreating index {key!r}')
-            tg.create_task(index_task(sql))
+            tg.create_task(index_task(key, sql))
 
 
 async def main() -> None:
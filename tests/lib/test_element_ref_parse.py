@@ -0,0 +1,63 @@
+import pytest
+
+from app.lib.element_ref_parse import parse_ref_id, parse_versioned_ref_id
+
+
+@pytest.mark.parametrize(
+    ('input', 'start', 'expected'),
+    [
+        ('n123', 1, 123),
+        ('w-5', 1, -5),
+        ('42', 0, 42),
+        ('n999999999999999999', 1, 999999999999999999),
+    ],
+)
+def test_parse_ref_id(input, start, expected):
+    assert parse_ref_id(input, start) == expected
+
+
+@pytest.mark.parametrize(
+    ('input', 'start', 'expected'),
+    [
+        ('n123v1', 1, (123, 1)),
+        ('r-1v5', 1, (-1, 5)),
+        ('7v2', 0, (7, 2)),
+    ],
+)
+def test_parse_versioned_ref_id(input, start, expected):
+    assert parse_versioned_ref_id(input, start) == expected
+
+
+@pytest.mark.parametrize(
+    ('input', 'start'),
+    [
+        ('n', 1),
+        ('n-', 1),
+        ('n0', 1),
+        ('n12a', 1),
+        ('n1 2', 1),
+        ('n9999999999999999999', 1),
+        ('n-9999999999999999999', 1),
+    ],
+)
+def test_parse_ref_id_invalid(input, start):
+    with pytest.raises(ValueError):
+        parse_ref_id(input, start)
+
+
+@pytest.mark.parametrize(
+    ('input', 'start'),
+    [
+        ('n123', 1),
+        ('n123v', 1),
+        ('nv1', 1),
+        ('n0v1', 1),
+        ('n1v0', 1),
+        ('n1v-1', 1),
+        ('n99999999999999999999v1', 1),
+        ('n1v99999999999999999999', 1),
+    ],
+)
+def test_parse_versioned_ref_id_invalid(input, start):
+    with pytest.raises(ValueError):
+        parse_versioned_ref_id(input, start)
@@ -1,6 +1,6 @@
 import pytest
 
-from app.lib.tags_format import tags_format
+from app.lib.tags_format import tag_format, tags_format
 from app.lib.translation import translation_context
 from app.models.tags_format import ValueFormat
 from app.models.types import LocaleCode
@@ -102,3 +102,38 @@ def test_tags_format(tags: dict[str, str], key: ValueFormat, values: list[ValueF
         collection = next(iter(formatted.values()))
         assert key == collection.key
         assert values == collection.values
+
+
+def test_tag_format():
+    with translation_context(LocaleCode('pl')):
+        formatted = tag_format('comment', 'https://example.com <script>')
+        assert formatted.key == ValueFormat('comment', 'url-safe', 'https://wiki.openstreetmap.org/wiki/Pl:Key:comment')
+        assert formatted.values == [
+            ValueFormat(
+                'https://example.com <script>',
+                'html',
+                '<a href="https://example.com" rel="nofollow">https://example.com</a> &lt;script&gt;',
+            )
+        ]
+
+
+def test_tags_format_cached():
+    tags = {'comment': 'https://example.com', 'amenity': 'bench'}
+    with translation_context(LocaleCode('pl')):
+        first = tags_format(tags)
+        with pytest.raises(TypeError):
+            first['comment'] = first['amenity']  # pyright: ignore[reportIndexIssue]
+        second = tags_format(tags)
+        assert second['comment'].key.text == 'comment'
+        assert second is first
+        assert list(second) == ['amenity', 'comment']
+
+
+def test_tags_format_locale():
+    tags = {'comment': 'test'}
+    with translation_context(LocaleCode('pl')):
+        pl = tags_format(tags)['comment'].key
+    with translation_context(LocaleCode('en')):
+        en = tags_format(tags)['comment'].key
+    assert pl.data == 'https://wiki.openstreetmap.org/wiki/Pl:Key:comment'
+    assert en.data == 'https://wiki.openstreetmap.org/wiki/Key:comment'